@@ -8,6 +8,9 @@ Description: Automated backup solution for Laravel Forge managed servers
 """
 
 import os
+import re
+import fcntl
+import heapq
 import sys
 import json
 import yaml
@@ -17,6 +20,9 @@ import tempfile
 import shutil
 import socket
 import signal
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
@@ -24,6 +30,8 @@ from typing import Dict, List, Optional, Tuple, Any
 # Third-party imports
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config as BotoConfig
     from botocore.exceptions import ClientError, NoCredentialsError
 except ImportError:
     print("Error: boto3 is required. Install with: pip install boto3")
@@ -31,6 +39,8 @@ except ImportError:
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: requests is required. Install with: pip install requests")
     sys.exit(1)
@@ -38,10 +48,111 @@ except ImportError:
 # Configuration
 SCRIPT_DIR = Path(__file__).parent.absolute()
 CONFIG_FILE = SCRIPT_DIR / "config.yaml"
-BACKUP_DIR = SCRIPT_DIR / "backups"
 LOG_FILE = SCRIPT_DIR / "backup.log"
 LOCK_FILE = SCRIPT_DIR / "backup.lock"
 
+# Archive extensions written by create_backup_archive (zstd or gzip)
+BACKUP_EXTENSIONS = ('.tar.zst', '.tar.gz')
+
+# Shared boto3 session for the process. botocore caches loaded service models on
+# the session, so any further clients created from it skip re-parsing them
+BOTO_SESSION = boto3.session.Session()
+
+# Site worker processes are spawned rather than forked, as the parent has
+# running threads whose held locks a forked child would inherit
+SITE_PROCESS_CONTEXT = multiprocessing.get_context('spawn')
+
+# Prefer the libyaml-backed loader when available
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# S3 upload tuning: archives are streamed as concurrent multipart chunks. A
+# streamed (non-seekable) upload buffers up to max_in_memory_upload_chunks
+# chunks plus the one being read, so memory use per site is roughly
+# (4 + 1) * 32MB = 160MB. 32MB chunks still allow archives up to ~320GB
+# (S3's 10,000 part limit).
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=32 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True
+)
+S3_TRANSFER_CONFIG.max_in_memory_upload_chunks = S3_TRANSFER_CONFIG.max_concurrency
+
+# Database settings in Laravel .env files, matched against the raw bytes so
+# only the captured values need decoding
+ENV_RE = re.compile(rb"^[ \t]*(DB_HOST|DB_DATABASE|DB_USERNAME|DB_PASSWORD|DB_PORT)[ \t]*=([^\r\n]*)", re.M)
+ENV_KEYS = {
+    b'DB_HOST': 'host', b'DB_DATABASE': 'name', b'DB_USERNAME': 'user', b'DB_PASSWORD': 'password', b'DB_PORT': 'port'
+}
+
+# Database settings in PHP config files, one pattern per application so each
+# file is scanned in a single pass. Every match yields a key and a value.
+WP_CONFIG_RE = re.compile(
+    r"define\s*\(\s*['\"](?P<key>DB_NAME|DB_USER|DB_PASSWORD|DB_HOST)['\"],\s*['\"](?P<value>[^'\"]*)['\"]"
+)
+WP_CONFIG_KEYS = {'DB_NAME': 'name', 'DB_USER': 'user', 'DB_PASSWORD': 'password', 'DB_HOST': 'host'}
+
+MW_SETTINGS_RE = re.compile(
+    r"\$(?P<key>wgDBserver|wgDBname|wgDBuser|wgDBpassword)\s*=\s*['\"](?P<value>[^'\"]*)['\"]"
+)
+MW_SETTINGS_KEYS = {'wgDBserver': 'host', 'wgDBname': 'name', 'wgDBuser': 'user', 'wgDBpassword': 'password'}
+
+# Invision Power Board supports both assignment syntax ($INFO['key'] = 'value')
+# and array syntax ($INFO = array('key' => 'value'))
+IPB_CONFIG_RE = re.compile(
+    r"(?:\$INFO\s*\[\s*['\"](?P<key>sql_host|sql_database|sql_user|sql_pass|sql_port)['\"]\s*\]\s*="
+    r"|['\"](?P<array_key>sql_host|sql_database|sql_user|sql_pass|sql_port)['\"]\s*=>)"
+    r"\s*['\"](?P<value>[^'\"]*)['\"]"
+)
+IPB_CONFIG_KEYS = {
+    'sql_host': 'host', 'sql_database': 'name', 'sql_user': 'user', 'sql_pass': 'password', 'sql_port': 'port'
+}
+
+def scan_config(pattern: re.Pattern, keys: Dict[str, str], content: str,
+                allow_empty: Tuple[str, ...] = ()) -> Dict[str, str]:
+    """Scan config file content once, returning the first usable value found for each setting"""
+    values = {}
+    array_values = {}
+    for match in pattern.finditer(content):
+        groups = match.groupdict()
+        field = keys[groups['key'] or groups.get('array_key')]
+        value = groups['value']
+        
+        # Empty values are skipped unless the field is in allow_empty, and ports
+        # must be numeric, so a later usable definition of the setting wins
+        if not value and field not in allow_empty:
+            continue
+        if field == 'port' and not value.isdigit():
+            continue
+            
+        # Assignment syntax takes precedence over array syntax, wherever it appears
+        if groups['key']:
+            values.setdefault(field, value)
+        else:
+            array_values.setdefault(field, value)
+            
+    for field, value in array_values.items():
+        values.setdefault(field, value)
+    return values
+
+def split_host_port(value: str) -> Tuple[str, Optional[str]]:
+    """Split a host:port value, leaving IPv6 addresses and socket paths untouched"""
+    if value.count(':') == 1 and '/' not in value:
+        host, port = value.rsplit(':', 1)
+        return host, port if port.isdigit() else None
+    return value, None
+
+class CountingReader:
+    """File-like wrapper that counts the bytes read from a stream"""
+    def __init__(self, stream):
+        self.stream = stream
+        self.bytes_read = 0
+        
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        self.bytes_read += len(data)
+        return data
+
 # ANSI color codes
 class Colors:
     RED = '\033[0;31m'
@@ -51,6 +162,15 @@ class Colors:
     NC = '\033[0m'  # No Color
 
 class BackupScript:
+    # Console colors per log level, only used when stdout is a terminal
+    LOG_COLORS = {
+        'ERROR': Colors.RED,
+        'SUCCESS': Colors.GREEN,
+        'WARNING': Colors.YELLOW,
+        'INFO': Colors.BLUE
+    }
+    USE_COLOR = sys.stdout.isatty()
+    
     def __init__(self):
         self.config = {}
         self.s3_client = None
@@ -61,37 +181,53 @@ class BackupScript:
         self.logger = None
         self.success_notification = True
         self.summary_notification = True
+        self._log_lock = threading.Lock()
+        self._lock_fd = None
+        self._site_processes = set()
+        self._process_lock = threading.Lock()
+        self._stopping = False
+        self._http = self.create_http_session()
         self.setup_logging()
         
     def setup_logging(self):
         """Setup logging configuration"""
+        # Console output is printed by log(), so only the log file is handled
+        # here. Messages already carry their timestamp and level.
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s [%(levelname)s] %(message)s',
+            format='%(message)s',
             handlers=[
-                logging.FileHandler(LOG_FILE),
-                logging.StreamHandler(sys.stdout)
+                logging.FileHandler(LOG_FILE)
             ]
         )
         self.logger = logging.getLogger(__name__)
         
+    def create_http_session(self) -> requests.Session:
+        """Create a keep-alive HTTP session for Discord notifications"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+        
     def log(self, level: str, message: str):
         """Log message with timestamp"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        colored_message = f"{timestamp} [{level}] {message}"
-        
-        # Add color for console output
-        if level == "ERROR":
-            colored_message = f"{Colors.RED}{colored_message}{Colors.NC}"
-        elif level == "SUCCESS":
-            colored_message = f"{Colors.GREEN}{colored_message}{Colors.NC}"
-        elif level == "WARNING":
-            colored_message = f"{Colors.YELLOW}{colored_message}{Colors.NC}"
-        elif level == "INFO":
-            colored_message = f"{Colors.BLUE}{colored_message}{Colors.NC}"
-            
-        print(colored_message)
-        self.logger.info(message)
+        line = f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} [{level}] {message}"
+        
+        # Site threads in the parent log concurrently, so keep console and log file
+        # output in step. Each line is a single flushed write so lines from site
+        # worker processes sharing stdout stay whole
+        with self._log_lock:
+            if self.USE_COLOR:
+                sys.stdout.write(f"{self.LOG_COLORS.get(level, '')}{line}{Colors.NC}\n")
+            else:
+                sys.stdout.write(f"{line}\n")
+            sys.stdout.flush()
+            self.logger.info(line)
         
     def log_error(self, message: str):
         """Log error message"""
@@ -111,24 +247,25 @@ class BackupScript:
         
     def check_lock(self):
         """Check if script is already running"""
-        if LOCK_FILE.exists():
-            try:
-                pid = int(LOCK_FILE.read_text().strip())
-                # Check if process is still running
-                os.kill(pid, 0)
-                self.log_error(f"Backup script is already running (PID: {pid})")
-                sys.exit(1)
-            except (ValueError, OSError):
-                # Process not running, remove stale lock file
-                self.log_warning("Removing stale lock file")
-                LOCK_FILE.unlink(missing_ok=True)
-                
-        # Create lock file
-        LOCK_FILE.write_text(str(os.getpid()))
+        # The kernel releases the flock when this process exits, however it exits,
+        # so a stale lock file never blocks the next run
+        fd = os.open(LOCK_FILE, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            pid = os.read(fd, 32).decode(errors='replace').strip()
+            os.close(fd)
+            self.log_error(f"Backup script is already running (PID: {pid or 'unknown'})")
+            sys.exit(1)
+            
+        # Record our PID, keeping the descriptor open to hold the lock
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._lock_fd = fd
         
     def cleanup_and_exit(self, exit_code: int = 0):
         """Cleanup and exit"""
-        LOCK_FILE.unlink(missing_ok=True)
+        self._http.close()
         sys.exit(exit_code)
         
     def load_config(self):
@@ -141,11 +278,18 @@ class BackupScript:
         
         try:
             with open(CONFIG_FILE, 'r') as f:
-                self.config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=YAML_LOADER)
         except yaml.YAMLError as e:
             self.log_error(f"Error parsing YAML configuration: {e}")
             sys.exit(1)
             
+        self.apply_config(config)
+        self.log_success("Configuration loaded successfully")
+        
+    def apply_config(self, config: Dict[str, Any]):
+        """Apply parsed configuration"""
+        self.config = config
+        
         # Extract global settings
         global_config = self.config.get('global', {})
         self.discord_webhook_url = global_config.get('discord_webhook_url', '')
@@ -177,19 +321,25 @@ class BackupScript:
         if not self.sites:
             self.log_error("No sites configured in configuration file")
             sys.exit(1)
-            
-        self.log_success("Configuration loaded successfully")
+        
+    def create_s3_client(self):
+        """Create an S3 client from the loaded configuration"""
+        return BOTO_SESSION.client(
+            's3',
+            endpoint_url=self.s3_config['endpoint_url'],
+            aws_access_key_id=self.s3_config['access_key'],
+            aws_secret_access_key=self.s3_config['secret_key'],
+            region_name=self.s3_config['region'],
+            config=BotoConfig(
+                max_pool_connections=32,
+                retries={'mode': 'adaptive'}
+            )
+        )
         
     def setup_s3_client(self):
         """Setup S3 client"""
         try:
-            self.s3_client = boto3.client(
-                's3',
-                endpoint_url=self.s3_config['endpoint_url'],
-                aws_access_key_id=self.s3_config['access_key'],
-                aws_secret_access_key=self.s3_config['secret_key'],
-                region_name=self.s3_config['region']
-            )
+            self.s3_client = self.create_s3_client()
             self.log_success("S3 client configured successfully")
         except Exception as e:
             self.log_error(f"Failed to setup S3 client: {e}")
@@ -219,7 +369,7 @@ class BackupScript:
                 }]
             }
             
-            response = requests.post(
+            response = self._http.post(
                 self.discord_webhook_url,
                 json=payload,
                 headers={'Content-Type': 'application/json'},
@@ -245,24 +395,8 @@ class BackupScript:
         if env_file.exists():
             self.log_info("Found .env file, extracting database config")
             try:
-                with open(env_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if '=' in line and not line.startswith('#'):
-                            key, value = line.split('=', 1)
-                            key = key.strip()
-                            value = value.strip().strip('"\'')
-                            
-                            if key == 'DB_HOST':
-                                db_config['host'] = value
-                            elif key == 'DB_DATABASE':
-                                db_config['name'] = value
-                            elif key == 'DB_USERNAME':
-                                db_config['user'] = value
-                            elif key == 'DB_PASSWORD':
-                                db_config['password'] = value
-                            elif key == 'DB_PORT':
-                                db_config['port'] = value
+                for key, value in ENV_RE.findall(env_file.read_bytes()):
+                    db_config[ENV_KEYS[key]] = value.strip().strip(b'"\'').decode(errors='replace')
             except Exception as e:
                 self.log_warning(f"Error reading .env file: {e}")
                 
@@ -271,27 +405,9 @@ class BackupScript:
         if wp_config.exists():
             self.log_info("Found wp-config.php, extracting database config")
             try:
-                with open(wp_config, 'r') as f:
-                    content = f.read()
-                    
-                # Extract database configuration using regex
-                import re
-                
-                db_name_match = re.search(r"define\s*\(\s*['\"]DB_NAME['\"],\s*['\"]([^'\"]+)['\"]", content)
-                if db_name_match:
-                    db_config['name'] = db_name_match.group(1)
-                    
-                db_user_match = re.search(r"define\s*\(\s*['\"]DB_USER['\"],\s*['\"]([^'\"]+)['\"]", content)
-                if db_user_match:
-                    db_config['user'] = db_user_match.group(1)
+                content = wp_config.read_text(errors='replace')
                     
-                db_pass_match = re.search(r"define\s*\(\s*['\"]DB_PASSWORD['\"],\s*['\"]([^'\"]+)['\"]", content)
-                if db_pass_match:
-                    db_config['password'] = db_pass_match.group(1)
-                    
-                db_host_match = re.search(r"define\s*\(\s*['\"]DB_HOST['\"],\s*['\"]([^'\"]+)['\"]", content)
-                if db_host_match:
-                    db_config['host'] = db_host_match.group(1)
+                db_config.update(scan_config(WP_CONFIG_RE, WP_CONFIG_KEYS, content))
                     
             except Exception as e:
                 self.log_warning(f"Error reading wp-config.php: {e}")
@@ -301,35 +417,19 @@ class BackupScript:
         if mw_settings.exists():
             self.log_info("Found LocalSettings.php, extracting database config")
             try:
-                with open(mw_settings, 'r') as f:
-                    content = f.read()
+                content = mw_settings.read_text(errors='replace')
 
-                import re
+                values = scan_config(MW_SETTINGS_RE, MW_SETTINGS_KEYS, content, allow_empty=('password',))
 
-                server_match = re.search(r"\$wgDBserver\s*=\s*['\"]([^'\"]+)['\"]", content)
-                if server_match:
-                    server_value = server_match.group(1).strip()
-                    # If server is in host:port format, split accordingly (avoid IPv6 and socket paths)
-                    if server_value.count(':') == 1 and '/' not in server_value:
-                        host_part, port_part = server_value.rsplit(':', 1)
-                        if host_part:
-                            db_config['host'] = host_part
-                        if port_part.isdigit():
-                            db_config['port'] = port_part
-                    else:
-                        db_config['host'] = server_value
+                server_value = values.pop('host', '').strip()
+                if server_value:
+                    host, port = split_host_port(server_value)
+                    if host:
+                        db_config['host'] = host
+                    if port:
+                        db_config['port'] = port
 
-                name_match = re.search(r"\$wgDBname\s*=\s*['\"]([^'\"]+)['\"]", content)
-                if name_match:
-                    db_config['name'] = name_match.group(1)
-
-                user_match = re.search(r"\$wgDBuser\s*=\s*['\"]([^'\"]+)['\"]", content)
-                if user_match:
-                    db_config['user'] = user_match.group(1)
-
-                pass_match = re.search(r"\$wgDBpassword\s*=\s*['\"]([^'\"]*)['\"]", content)
-                if pass_match:
-                    db_config['password'] = pass_match.group(1)
+                db_config.update(values)
 
             except Exception as e:
                 self.log_warning(f"Error reading LocalSettings.php: {e}")
@@ -339,62 +439,19 @@ class BackupScript:
         if conf_global.exists():
             self.log_info("Found conf_global.php, extracting database config")
             try:
-                with open(conf_global, 'r') as f:
-                    content = f.read()
+                content = conf_global.read_text(errors='replace')
                     
-                import re
-                
-                # Support both assignment syntax ($INFO['key'] = 'value') and array syntax ($INFO = array('key' => 'value'))
-                def first_match(patterns):
-                    for pattern in patterns:
-                        match = re.search(pattern, content)
-                        if match:
-                            return match.group(1)
-                    return None
+                values = scan_config(IPB_CONFIG_RE, IPB_CONFIG_KEYS, content, allow_empty=('password',))
 
-                host_value = first_match([
-                    r"\$INFO\s*\[\s*['\"]sql_host['\"]\s*\]\s*=\s*['\"]([^'\"]+)['\"]",
-                    r"['\"]sql_host['\"]\s*=>\s*['\"]([^'\"]+)['\"]",
-                ])
+                host_value = values.pop('host', '')
                 if host_value:
-                    # Handle optional host:port format (avoid IPv6 and socket paths)
-                    if host_value.count(':') == 1 and '/' not in host_value:
-                        host_part, port_part = host_value.rsplit(':', 1)
-                        if host_part:
-                            db_config['host'] = host_part
-                        if port_part.isdigit():
-                            db_config['port'] = port_part
-                    else:
-                        db_config['host'] = host_value
-
-                db_value = first_match([
-                    r"\$INFO\s*\[\s*['\"]sql_database['\"]\s*\]\s*=\s*['\"]([^'\"]+)['\"]",
-                    r"['\"]sql_database['\"]\s*=>\s*['\"]([^'\"]+)['\"]",
-                ])
-                if db_value:
-                    db_config['name'] = db_value
-
-                user_value = first_match([
-                    r"\$INFO\s*\[\s*['\"]sql_user['\"]\s*\]\s*=\s*['\"]([^'\"]+)['\"]",
-                    r"['\"]sql_user['\"]\s*=>\s*['\"]([^'\"]+)['\"]",
-                ])
-                if user_value:
-                    db_config['user'] = user_value
-
-                pass_value = first_match([
-                    r"\$INFO\s*\[\s*['\"]sql_pass['\"]\s*\]\s*=\s*['\"]([^'\"]*)['\"]",
-                    r"['\"]sql_pass['\"]\s*=>\s*['\"]([^'\"]*)['\"]",
-                ])
-                if pass_value is not None:
-                    db_config['password'] = pass_value
+                    host, port = split_host_port(host_value)
+                    if host:
+                        db_config['host'] = host
+                    if port:
+                        db_config['port'] = port
 
-                # Optional explicit port key
-                port_value = first_match([
-                    r"\$INFO\s*\[\s*['\"]sql_port['\"]\s*\]\s*=\s*['\"](\d+)['\"]",
-                    r"['\"]sql_port['\"]\s*=>\s*['\"](\d+)['\"]",
-                ])
-                if port_value and port_value.isdigit():
-                    db_config['port'] = port_value
+                db_config.update(values)
                     
             except Exception as e:
                 self.log_warning(f"Error reading conf_global.php: {e}")
@@ -416,16 +473,18 @@ class BackupScript:
             self.log_warning(f"Database configuration not found for {site_name}, skipping database backup")
             return False
             
-        db_backup_file = backup_path / f"{site_name}_database.sql"
+        db_backup_file = backup_path / f"{site_name}_database.sql.gz"
         
         try:
             # Use mysqldump command for better compatibility
-            cmd = [
-                'mysqldump',
-                '-h', db_config['host'],
-                '-P', db_config['port'],
-                '-u', db_config['user']
-            ]
+            cmd = ['mysqldump']
+            
+            # The default localhost:3306 is what mysqldump uses without -h/-P; a
+            # non-default port may be a second local server, so pass it explicitly
+            if (db_config['host'], db_config['port']) != ('localhost', '3306'):
+                cmd.extend(['-h', db_config['host'], '-P', db_config['port']])
+                
+            cmd.extend(['-u', db_config['user']])
             
             if db_config['password']:
                 cmd.extend(['-p' + db_config['password']])
@@ -437,14 +496,32 @@ class BackupScript:
                 db_config['name']
             ])
             
-            with open(db_backup_file, 'w') as f:
-                result = subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE, text=True)
+            # Compress the dump as it is written so the raw SQL never hits disk
+            compressor = 'pigz' if shutil.which('pigz') else 'gzip'
+            
+            with open(db_backup_file, 'wb') as f, tempfile.TemporaryFile() as stderr_file:
+                dump = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+                compress = subprocess.Popen([compressor, '-c'], stdin=dump.stdout, stdout=f)
+                # Let mysqldump see a broken pipe if the compressor exits early
+                dump.stdout.close()
+                try:
+                    compress_returncode = compress.wait()
+                    dump_returncode = dump.wait()
+                except BaseException:
+                    # Interrupted: don't leave the dump running once the temp dir is removed
+                    dump.kill()
+                    compress.kill()
+                    raise
+                
+                stderr_file.seek(0)
+                dump_error = stderr_file.read().decode(errors='replace').strip()
                 
-            if result.returncode == 0:
+            if dump_returncode == 0 and compress_returncode == 0:
                 self.log_success(f"Database backup created: {db_backup_file}")
                 return True
             else:
-                self.log_warning(f"Failed to backup database for {site_name}: {result.stderr}")
+                error = dump_error if dump_returncode != 0 else f"{compressor} exited with code {compress_returncode}"
+                self.log_warning(f"Failed to backup database for {site_name}: {error}")
                 db_backup_file.unlink(missing_ok=True)
                 return False
                 
@@ -453,92 +530,127 @@ class BackupScript:
             db_backup_file.unlink(missing_ok=True)
             return False
             
-    def create_backup_archive(self, site_name: str, site_path: Path, temp_dir: Path, 
-                             exclude_patterns: List[str], compression_level: int) -> Path:
-        """Create backup archive"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_filename = f"{site_name}_{timestamp}.tar.gz"
-        local_backup_path = BACKUP_DIR / backup_filename
-        
+    def archive_compression(self, compression_level: int) -> Tuple[str, str]:
+        """Pick the archive compressor, returning the command and file extension"""
+        # Prefer multi-threaded zstd, then pigz (parallel gzip), falling back to gzip
+        if shutil.which('zstd'):
+            return f"zstd -T0 -{compression_level}", '.tar.zst'
+        if shutil.which('pigz'):
+            return f"pigz -{compression_level}", '.tar.gz'
+        return f"gzip -{compression_level}", '.tar.gz'
+        
+    def create_backup_archive(self, site_path: Path, temp_dir: Optional[Path], exclude_patterns: List[str],
+                              compress_program: str, stderr) -> subprocess.Popen:
+        """Start tar writing a compressed backup archive to stdout"""
         # Create exclude file if patterns are specified
-        exclude_file = None
+        exclude_args = []
         if exclude_patterns:
             exclude_file = temp_dir / "exclude_patterns.txt"
             with open(exclude_file, 'w') as f:
                 for pattern in exclude_patterns:
                     f.write(f"{pattern}\n")
+            exclude_args = ['--exclude-from', os.fspath(exclude_file)]
                     
-        # Create tar command
-        cmd = ['tar', '-czf', str(local_backup_path)]
-        
-        if exclude_file:
-            cmd.extend(['--exclude-from', str(exclude_file)])
+        # Create tar command, writing the archive of the site directory to stdout
+        parent = os.fspath(site_path.parent)
+        name = site_path.name
+        cmd = ['tar', '--use-compress-program', compress_program, '-cf', '-', *exclude_args, '-C', parent, name]
+        
+        # Add temp directory contents (database dump, exclude list)
+        if temp_dir is not None and any(temp_dir.iterdir()):
+            cmd.extend(['-C', os.fspath(temp_dir), '.'])
             
-        # Add site directory
-        cmd.extend(['-C', str(site_path.parent), site_path.name])
+        return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
         
-        # Add temp directory contents
-        if temp_dir.exists() and any(temp_dir.iterdir()):
-            cmd.extend(['-C', str(temp_dir), '.'])
-            
-        self.log_info(f"Creating archive: {backup_filename}")
+    def stream_backup_to_s3(self, site_name: str, site_path: Path, temp_dir: Optional[Path],
+                            exclude_patterns: List[str], compression_level: int) -> Tuple[str, int]:
+        """Stream backup archive straight into S3, returning the file name and size"""
+        compress_program, extension = self.archive_compression(compression_level)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        backup_filename = f"{site_name}_{timestamp}{extension}"
+        s3_key = f"{site_name}/{backup_filename}"
         
-        try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            return local_backup_path
-        except subprocess.CalledProcessError as e:
-            self.log_error(f"Failed to create archive: {e}")
-            raise
+        self.log_info(f"Streaming archive to S3: {backup_filename}")
+        
+        # tar stderr goes to a temporary file so a chatty tar can never block on a full pipe
+        with tempfile.TemporaryFile() as stderr_file:
+            process = self.create_backup_archive(
+                site_path, temp_dir, exclude_patterns, compress_program, stderr_file
+            )
+            archive = CountingReader(process.stdout)
             
-    def upload_to_s3(self, local_path: Path, s3_key: str) -> bool:
-        """Upload file to S3"""
-        try:
-            self.s3_client.upload_file(str(local_path), self.s3_config['bucket'], s3_key)
-            return True
-        except Exception as e:
-            self.log_error(f"Failed to upload to S3: {e}")
-            return False
+            try:
+                self.s3_client.upload_fileobj(
+                    archive,
+                    self.s3_config['bucket'],
+                    s3_key,
+                    Config=S3_TRANSFER_CONFIG
+                )
+            except Exception as e:
+                process.kill()
+                process.wait()
+                raise RuntimeError(f"Failed to upload backup to S3: {e}") from e
+            except BaseException:
+                # Interrupted: stop tar along with the upload
+                process.kill()
+                process.wait()
+                raise
+            finally:
+                process.stdout.close()
+                
+            returncode = process.wait()
+            if returncode != 0:
+                stderr_file.seek(0)
+                error = stderr_file.read().decode(errors='replace').strip()
+                # Don't leave a truncated archive behind in the bucket
+                try:
+                    self.s3_client.delete_object(Bucket=self.s3_config['bucket'], Key=s3_key)
+                except Exception as e:
+                    self.log_warning(f"Failed to remove incomplete backup {backup_filename}: {e}")
+                raise RuntimeError(f"Failed to create archive (tar exit code {returncode}): {error}")
+                
+        return backup_filename, archive.bytes_read
             
     def cleanup_old_backups(self, site_name: str, retention_days: int, success_notification: bool = True):
         """Clean up old backups"""
         self.log_info(f"Cleaning up old backups for {site_name} (keeping {retention_days} days)")
         
         try:
-            # List all backups for the site
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.s3_config['bucket'],
-                Prefix=f"{site_name}/"
-            )
+            # List all backups for the site, across as many pages as needed
+            prefix = f"{site_name}/{site_name}_"
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            pages = paginator.paginate(Bucket=self.s3_config['bucket'], Prefix=prefix)
             
-            if 'Contents' not in response:
-                return
-                
-            # Filter and sort backups
-            backups = []
-            for obj in response['Contents']:
-                key = obj['Key']
-                if key.startswith(f"{site_name}/{site_name}_") and key.endswith('.tar.gz'):
-                    backups.append({
-                        'key': key,
-                        'last_modified': obj['LastModified']
-                    })
-                    
-            # Sort by date (oldest first)
-            backups.sort(key=lambda x: x['last_modified'])
+            keys = [
+                obj['Key']
+                for page in pages
+                for obj in page.get('Contents', [])
+                if obj['Key'].endswith(BACKUP_EXTENSIONS)
+            ]
             
-            # Calculate how many to keep
+            # Keys end in a %Y%m%d_%H%M%S timestamp, so the smallest keys are
+            # the oldest backups
             backups_to_keep = retention_days
-            if len(backups) > backups_to_keep:
-                backups_to_delete = len(backups) - backups_to_keep
-                deleted_count = 0
+            if len(keys) > backups_to_keep:
+                backups_to_delete = heapq.nsmallest(len(keys) - backups_to_keep, keys)
                 
-                for backup in backups[:backups_to_delete]:
+                # delete_objects accepts up to 1000 keys per request
+                for i in range(0, len(backups_to_delete), 1000):
+                    batch = backups_to_delete[i:i + 1000]
                     try:
-                        self.s3_client.delete_object(
+                        response = self.s3_client.delete_objects(
                             Bucket=self.s3_config['bucket'],
-                            Key=backup['key']
+                            Delete={
+                                'Objects': [{'Key': key} for key in batch],
+                                'Quiet': False
+                            }
                         )
-                        filename = backup['key'].split('/')[-1]
+                    except Exception as e:
+                        self.log_warning(f"Failed to delete {len(batch)} old backups for {site_name}: {e}")
+                        continue
+                        
+                    for deleted in response.get('Deleted', []):
+                        filename = deleted['Key'].split('/')[-1]
                         self.log_success(f"Deleted old backup: {filename}")
                         if success_notification:
                             self.send_discord_notification(
@@ -546,10 +658,10 @@ class BackupScript:
                                 f"Site: {site_name}\nFile: {filename}",
                                 10181046
                             )
-                        deleted_count += 1
-                    except Exception as e:
-                        filename = backup['key'].split('/')[-1]
-                        self.log_warning(f"Failed to delete old backup {filename}: {e}")
+                            
+                    for error in response.get('Errors', []):
+                        filename = error['Key'].split('/')[-1]
+                        self.log_warning(f"Failed to delete old backup {filename}: {error.get('Message', error.get('Code'))}")
                         
         except Exception as e:
             self.log_warning(f"Error during cleanup for {site_name}: {e}")
@@ -581,57 +693,33 @@ class BackupScript:
             )
             return False
             
-        # Create temporary backup directory
-        temp_dir = Path(tempfile.mkdtemp(prefix=f"backup_{site_name}_"))
-        local_backup_path = None
+        # Create temporary backup directory, only needed for the database dump and exclude list
+        temp_dir = None
+        if backup_db or exclude_patterns:
+            temp_dir = Path(tempfile.mkdtemp(prefix=f"backup_{site_name}_"))
         
         try:
             # Backup database if enabled
             if backup_db:
                 self.backup_database(site_name, user_path, temp_dir)
                 
-            # Create backup archive
-            local_backup_path = self.create_backup_archive(
+            # Create the archive and upload it to S3 in one pass
+            backup_filename, backup_size = self.stream_backup_to_s3(
                 site_name, user_path, temp_dir, exclude_patterns, compression_level
             )
-            
-            # Get backup size
-            backup_size = local_backup_path.stat().st_size
             backup_size_mb = backup_size / (1024 * 1024)
             
-            self.log_success(f"Archive created successfully: {local_backup_path.name} ({backup_size_mb:.1f} MB)")
-            
-            # Upload to S3
-            s3_key = f"{site_name}/{local_backup_path.name}"
-            self.log_info(f"Uploading to S3: {local_backup_path.name}")
-            
-            if self.upload_to_s3(local_backup_path, s3_key):
-                self.log_success(f"Upload completed: {local_backup_path.name}")
-                if success_notification:
-                    self.send_discord_notification(
-                        "✅ **Backup Successful**",
-                        f"Site: {site_name}\nSize: {backup_size_mb:.1f} MB\nFile: {local_backup_path.name}",
-                        3066993
-                    )
-                
-                # Clean up old backups
-                self.cleanup_old_backups(site_name, retention_days, success_notification)
-                
-                # Remove local backup
-                local_backup_path.unlink()
-                self.log_info(f"Local backup removed: {local_backup_path.name}")
-                return True
-            else:
-                self.log_error(f"Failed to upload backup: {local_backup_path.name}")
+            self.log_success(f"Upload completed: {backup_filename} ({backup_size_mb:.1f} MB)")
+            if success_notification:
                 self.send_discord_notification(
-                    "❌ **Backup Failed**",
-                    f"Site: {site_name}\nReason: Failed to upload backup to S3",
-                    15158332  # Red color
+                    "✅ **Backup Successful**",
+                    f"Site: {site_name}\nSize: {backup_size_mb:.1f} MB\nFile: {backup_filename}",
+                    3066993
                 )
-                # Clean up local backup file on failure
-                local_backup_path.unlink(missing_ok=True)
-                self.log_info(f"Local backup removed after failure: {local_backup_path.name}")
-                return False
+            
+            # Clean up old backups
+            self.cleanup_old_backups(site_name, retention_days, success_notification)
+            return True
                 
         except Exception as e:
             self.log_error(f"Failed to backup site {site_name}: {e}")
@@ -640,15 +728,59 @@ class BackupScript:
                 f"Site: {site_name}\nReason: {str(e)}",
                 15158332  # Red color
             )
-            # Clean up local backup file if it was created before the exception
-            if local_backup_path and local_backup_path.exists():
-                local_backup_path.unlink(missing_ok=True)
-                self.log_info(f"Local backup removed after exception: {local_backup_path.name}")
             return False
         finally:
             # Clean up temporary directory
-            shutil.rmtree(temp_dir, ignore_errors=True)
+            if temp_dir is not None:
+                shutil.rmtree(temp_dir, ignore_errors=True)
             
+    def run_site_process(self, site_config: Dict[str, Any]) -> bool:
+        """Backup a single site in its own process"""
+        site_name = site_config['name']
+        
+        with self._process_lock:
+            if self._stopping:
+                return False
+            receiver, sender = SITE_PROCESS_CONTEXT.Pipe(duplex=False)
+            process = SITE_PROCESS_CONTEXT.Process(
+                target=site_worker,
+                args=(self.config, site_config, sender),
+                name=f"backup-{site_name}"
+            )
+            process.start()
+            self._site_processes.add(process)
+        sender.close()
+        
+        try:
+            success = receiver.recv()
+        except EOFError:
+            # The process exited without reporting a result
+            success = None
+        finally:
+            receiver.close()
+            process.join()
+            with self._process_lock:
+                self._site_processes.discard(process)
+                
+        if success is None:
+            if not self._stopping:
+                reason = f"Backup process exited unexpectedly (exit code {process.exitcode})"
+                self.log_error(f"Failed to backup site {site_name}: {reason}")
+                self.send_discord_notification(
+                    "❌ **Backup Failed**",
+                    f"Site: {site_name}\nReason: {reason}",
+                    15158332  # Red color
+                )
+            return False
+        return success
+        
+    def stop_site_processes(self):
+        """Terminate running site processes and stop new ones from starting"""
+        with self._process_lock:
+            self._stopping = True
+            for process in self._site_processes:
+                process.terminate()
+                
     def main(self):
         """Main backup process"""
         self.log_info("Starting backup process")
@@ -656,13 +788,10 @@ class BackupScript:
         # Check for lock file
         self.check_lock()
         
-        # Create backup directory
-        BACKUP_DIR.mkdir(exist_ok=True)
-        
         # Load configuration
         self.load_config()
         
-        # Setup S3 client
+        # Setup S3 client, failing the run before any site processes start
         self.setup_s3_client()
         
         # Process each site
@@ -670,11 +799,33 @@ class BackupScript:
         successful_backups = 0
         failed_backups = 0
         
-        for site_config in self.sites:
-            if self.backup_site(site_config):
-                successful_backups += 1
-            else:
-                failed_backups += 1
+        parallel_sites = max(1, int(self.defaults.get('parallel_sites', 4)))
+        self.log_info(f"Backing up {site_count} sites ({parallel_sites} in parallel)")
+        
+        # Each site is backed up in its own process, so a site that crashes its
+        # process only fails that site
+        with ThreadPoolExecutor(max_workers=parallel_sites) as executor:
+            futures = {
+                executor.submit(self.run_site_process, site_config): site_config['name']
+                for site_config in self.sites
+            }
+            try:
+                for future in as_completed(futures):
+                    try:
+                        success = future.result()
+                    except Exception as e:
+                        self.log_error(f"Unexpected error backing up {futures[future]}: {e}")
+                        success = False
+                        
+                    if success:
+                        successful_backups += 1
+                    else:
+                        failed_backups += 1
+            except BaseException:
+                # Interrupted: drop queued sites and stop the ones still running
+                self.stop_site_processes()
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
                 
         # Send summary notification (if enabled)
         if self.summary_notification:
@@ -695,10 +846,24 @@ class BackupScript:
             
         self.cleanup_and_exit(0)
         
+def site_worker(config: Dict[str, Any], site_config: Dict[str, Any], conn):
+    """Backup a single site in a worker process, sending the result back to the parent"""
+    # The parent handles interrupts and terminates its site processes itself.
+    # SIGTERM exits through SystemExit so the temp dir is removed and boto3
+    # aborts any in-flight multipart upload.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(143))
+    
+    script = BackupScript()
+    script.apply_config(config)
+    # Settings were validated by the parent, so any error here is raised as is
+    script.s3_client = script.create_s3_client()
+    conn.send(script.backup_site(site_config))
+    conn.close()
+    
 def signal_handler(signum, frame):
     """Handle interrupt signals"""
     print("\nReceived interrupt signal, cleaning up...")
-    LOCK_FILE.unlink(missing_ok=True)
     sys.exit(130)
     
 if __name__ == "__main__":